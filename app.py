@@ -0,0 +1,348 @@
+"""
+Application runtime for the Cryptocurrency Density Scanner.
+Runs the Telegram bot and scanner concurrently in a single async event loop.
+"""
+
+import asyncio
+import atexit
+import logging
+import queue
+import random
+import signal
+import sys
+import time
+import types
+from datetime import timedelta
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Tuple
+
+from config import (
+    OWNER_USER_ID,
+    ALERT_BATCH_SIZE,
+    ALERT_BATCH_DELAY,
+    TELEGRAM_MESSAGE_LIMIT,
+    ALERT_SEPARATOR,
+    MAX_RETRIES,
+    TELEGRAM_BACKOFF_BASE,
+    TELEGRAM_BACKOFF_CAP,
+    CHAT_VALIDATION_TTL,
+)
+from settings_manager import SettingsManager
+from scanner import DensityScanner, DensityAlert
+from bot import build_bot_app
+from telegram.constants import ParseMode
+from telegram.error import BadRequest, ChatMigrated, Forbidden, NetworkError, RetryAfter, TimedOut
+
+
+def setup_logging():
+    """
+    Configure logging to console and file.
+    Records are queued by the caller and written by a background listener
+    thread, so console/file I/O never blocks the event loop.
+    """
+    logger = logging.getLogger()
+    if logger.handlers:
+        return logger  # Already configured
+
+    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    logger.setLevel(logging.INFO)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(logging.Formatter(log_format))
+
+    file_handler = logging.FileHandler("scanner.log")
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(logging.Formatter(log_format))
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush remaining records on exit
+
+    return logger
+
+
+logger = logging.getLogger(__name__)
+
+# Shared send_message options for every alert
+_SEND_KW = types.MappingProxyType(
+    {"parse_mode": ParseMode.HTML, "disable_web_page_preview": True}
+)
+
+# BadRequest messages meaning the alert chat is unreachable
+CHAT_NOT_FOUND_MESSAGES = frozenset({"chat not found", "chat_id is empty"})
+
+
+def group_alert_messages(alerts: List[DensityAlert]) -> List[Tuple[str, int]]:
+    """
+    Join formatted alerts into as few messages as possible.
+    Each message stays below TELEGRAM_MESSAGE_LIMIT characters.
+    
+    Returns:
+        List of (message, number of alerts in the message)
+    """
+    messages = []
+    current = ""
+    count = 0
+    for alert in alerts:
+        text = alert.format_message()
+        if current and len(current) + len(ALERT_SEPARATOR) + len(text) > TELEGRAM_MESSAGE_LIMIT:
+            messages.append((current, count))
+            current = ""
+            count = 0
+        current = f"{current}{ALERT_SEPARATOR}{text}" if current else text
+        count += 1
+    if current:
+        messages.append((current, count))
+    return messages
+
+
+def retry_after_seconds(error: RetryAfter) -> float:
+    """Return the flood-control wait from a RetryAfter error in seconds."""
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class AlertBuffer:
+    """
+    Coalescing alert buffer between the scanner and the Telegram sender.
+    Keeps only the latest alert per (exchange, symbol, side) and wakes the
+    consumer when new alerts arrive.
+    """
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError(f"AlertBuffer maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._pending: Dict[Tuple[str, str, str], DensityAlert] = {}
+        self._wake = asyncio.Event()
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    def put(self, alert: DensityAlert):
+        """Store an alert, replacing any pending alert for the same key."""
+        key = (alert.exchange, alert.symbol, alert.side)
+        # Re-insert so a refreshed alert moves to the back of the send order
+        if self._pending.pop(key, None) is None and len(self._pending) >= self.maxsize:
+            oldest_key = next(iter(self._pending))
+            del self._pending[oldest_key]
+            logger.warning(f"Alert buffer is full! Dropping oldest alert for {oldest_key[1]}")
+        self._pending[key] = alert
+        self._wake.set()
+    
+    async def get_batch(self, limit: int) -> List[DensityAlert]:
+        """Wait until alerts are pending, then pop up to `limit` of them in order."""
+        while not self._pending:
+            self._wake.clear()
+            await self._wake.wait()
+        batch = []
+        while self._pending and len(batch) < limit:
+            batch.append(self._pending.pop(next(iter(self._pending))))
+        return batch
+
+
+def make_alert_callback(alert_buffer: AlertBuffer) -> Callable[[DensityAlert], None]:
+    """Build the scanner alert callback that feeds the coalescing alert buffer."""
+    def alert_callback(alert: DensityAlert):
+        """Alert callback with exception handling."""
+        try:
+            alert_buffer.put(alert)
+        except Exception as e:
+            logger.error(f"Failed to queue alert: {e}")
+
+    return alert_callback
+
+
+async def send_alert_message(bot, chat_id: int, message: str):
+    """
+    Send a message to the alert chat.
+    Waits out Telegram flood control once and retries timeouts/network
+    errors with exponential backoff; other errors are raised.
+    """
+    flood_retried = False
+    attempt = 0
+    while True:
+        try:
+            await bot.send_message(chat_id=chat_id, text=message, **_SEND_KW)
+            return
+        except RetryAfter as e:
+            if flood_retried:
+                raise
+            flood_retried = True
+            delay = retry_after_seconds(e) + 0.5
+            logger.warning(f"Telegram flood control hit, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        except BadRequest:
+            raise  # BadRequest subclasses NetworkError but is never transient
+        except (TimedOut, NetworkError) as e:
+            if attempt >= MAX_RETRIES:
+                raise
+            backoff = TELEGRAM_BACKOFF_BASE * 2 ** attempt
+            delay = min(TELEGRAM_BACKOFF_CAP, backoff + random.uniform(0, backoff / 2))
+            attempt += 1
+            logger.warning(
+                f"Telegram send failed ({e}), retry {attempt}/{MAX_RETRIES} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+
+async def process_alerts(bot, settings: SettingsManager, alert_buffer: AlertBuffer):
+    """Drain the alert buffer and deliver alerts to Telegram in batches."""
+    while True:
+        batch = await alert_buffer.get_batch(ALERT_BATCH_SIZE)
+
+        for message, alert_count in group_alert_messages(batch):
+            try:
+                await send_alert_message(bot, settings.chat_id, message)
+                logger.debug("Alert message sent: %d alert(s)", alert_count)
+            except Exception as e:
+                logger.error(f"Error sending alert to chat {settings.chat_id}: {e}")
+                # Force a fresh access check on the next start when the chat is unreachable
+                if isinstance(e, (Forbidden, ChatMigrated)):
+                    settings.clear_chat_validation()
+                if isinstance(e, ChatMigrated):
+                    logger.error(
+                        f"Chat {settings.chat_id} was migrated to {e.new_chat_id}. "
+                        "Update CHAT_ID in .env"
+                    )
+                # Log additional details for debugging
+                if isinstance(e, BadRequest) and e.message.lower() in CHAT_NOT_FOUND_MESSAGES:
+                    settings.clear_chat_validation()
+                    logger.error(
+                        f"Chat {settings.chat_id} not found. "
+                        "Please ensure: 1) Bot is added to the chat, "
+                        "2) Chat ID is correct (use @userinfobot), "
+                        "3) Bot has permission to send messages"
+                    )
+            # Stay within Telegram rate limits between sends
+            await asyncio.sleep(ALERT_BATCH_DELAY)
+
+
+class ShutdownRequested(Exception):
+    """Raised inside the task group to cancel sibling tasks on shutdown."""
+
+
+async def run_scanner(scanner: DensityScanner, stop_event: asyncio.Event):
+    """
+    Run the scanner and request shutdown once it exits on its own.
+    Errors propagate to the task group instead of posing as a clean stop.
+    """
+    await scanner.run()
+    logger.info("Scanner exited, requesting shutdown...")
+    stop_event.set()
+
+
+async def wait_for_shutdown(stop_event: asyncio.Event):
+    """Wait for a shutdown request, then tear down the task group."""
+    await stop_event.wait()
+    raise ShutdownRequested
+
+
+async def async_main(settings: SettingsManager):
+    """
+    Async main entry point.
+    
+    Args:
+        settings: Settings source prepared by the entry point
+    """
+    banner = "=" * 60
+    logger.info("\n%s\nStarting Cryptocurrency Density Scanner\n%s", banner, banner)
+
+    # Trip an event straight from the event loop on SIGINT/SIGTERM
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+
+    def request_shutdown(signum: int):
+        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+        stop_event.set()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_shutdown, sig)
+        except NotImplementedError:
+            # Windows event loops lack add_signal_handler; hop back onto the loop instead
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(request_shutdown, signum))
+
+    logger.info("Settings loaded from .env")
+
+    # Log the configured settings for debugging
+    from config import BOT_TOKEN
+    logger.info("Configured Chat ID: %s (type: %s)", settings.chat_id, type(settings.chat_id).__name__)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Bot Token: %s... (truncated)", BOT_TOKEN[:20])
+    logger.info(f"Owner ID: {OWNER_USER_ID}")
+    logger.info(f"Alerts Enabled: {settings.alerts_enabled}")
+
+    bot_app = build_bot_app(settings)
+    logger.info("Telegram bot initialized")
+
+    alert_buffer = AlertBuffer(maxsize=settings.alert_queue_maxsize)
+
+    scanner = DensityScanner(settings, make_alert_callback(alert_buffer))
+
+    async with bot_app:
+        await bot_app.start()
+        
+        # Validate chat access before starting scanner (skipped while a recent success is cached)
+        settings.load_chat_validation()
+        if settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL):
+            validation_age = time.time() - settings.last_validated_at
+            logger.info(
+                f"Chat {settings.chat_id} previously validated "
+                f"({validation_age / 3600:.1f}h ago, type: {settings.last_validated_chat_type}), skipping probe"
+            )
+        else:
+            try:
+                logger.info(f"Validating access to chat {settings.chat_id}...")
+                # Try to get chat info to verify bot has access
+                chat = await bot_app.bot.get_chat(settings.chat_id)
+                chat_name = chat.title if chat.title else f"Chat {chat.id}"
+                logger.info(f"✅ Successfully connected to chat: {chat_name}")
+                logger.info(f"   Chat type: {chat.type}")
+                settings.mark_chat_validated(settings.chat_id, chat.type)
+            
+            except Exception as e:
+                logger.error(f"❌ Failed to access chat {settings.chat_id}: {e}")
+                logger.error(
+                    "Please check:\n"
+                    "  1. Chat ID is correct (use @userinfobot to get it)\n"
+                    "  2. Bot is added to the chat/group\n"
+                    "  3. Bot has permission to send messages\n"
+                    f"  4. For groups, Chat ID should be negative (e.g., -5017751590)\n"
+                    f"  Current Chat ID: {settings.chat_id}"
+                )
+                logger.error("❌ STOPPING bot due to chat access failure")
+                logger.error("   Fix the .env file and restart the bot")
+                return  # Exit early - don't start the bot
+        
+        await bot_app.updater.start_polling(
+            allowed_updates=["message", "callback_query"]
+        )
+        logger.info("Bot is ready! Use /start to begin")
+
+        try:
+            # Structured concurrency: an error in any task cancels the others
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(run_scanner(scanner, stop_event), name="scanner")
+                tg.create_task(process_alerts(bot_app.bot, settings, alert_buffer), name="alerts")
+                tg.create_task(wait_for_shutdown(stop_event), name="shutdown")
+        except* ShutdownRequested:
+            logger.info("Shutdown requested, stopping tasks...")
+        except* Exception as eg:
+            # Log task failures through the logging pipeline (scanner.log), then propagate
+            for exc in eg.exceptions:
+                logger.error(f"Task failed, stopping: {exc!r}", exc_info=exc)
+            raise
+        finally:
+            logger.info("Shutting down...")
+            scanner.stop()
+            
+            await bot_app.updater.stop()
+            await bot_app.stop()
+            await bot_app.shutdown()
+            logger.info("Shutdown complete")
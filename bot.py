@@ -3,6 +3,7 @@ Telegram Bot with hierarchical inline menu (Russian).
 Complete management through inline buttons.
 """
 
+import asyncio
 import logging
 import time
 from collections import defaultdict
@@ -14,13 +15,14 @@ from telegram.ext import (
     CommandHandler,
     CallbackQueryHandler,
     MessageHandler,
+    BaseRateLimiter,
     ContextTypes,
     ConversationHandler,
     filters,
 )
 from telegram.constants import ParseMode
 
-from config import BOT_TOKEN, SUPPORTED_EXCHANGES, OWNER_USER_ID
+from config import BOT_TOKEN, SUPPORTED_EXCHANGES, OWNER_USER_ID, TELEGRAM_RATE_LIMIT, TELEGRAM_BURST
 from settings_manager import SettingsManager
 
 logger = logging.getLogger(__name__)
@@ -66,6 +68,62 @@ class RateLimiter:
 rate_limiter = RateLimiter(max_requests=30, window=60)
 
 
+class TokenBucket:
+    """
+    Async token-bucket throttle for outbound Telegram API calls.
+    Waiters are served in arrival order; `capacity` tokens absorb bursts while
+    `rate` tokens per second bound the long-run call rate.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    async def acquire(self, cost: float = 1):
+        """Wait until `cost` tokens are available, then consume them."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < cost:
+                await asyncio.sleep((cost - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= cost
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class TokenBucketRateLimiter(BaseRateLimiter):
+    """
+    PTB rate limiter that routes every Bot API request through a TokenBucket.
+    Installed on the Application, so alerts, the chat probe and all menu
+    replies share one outbound budget.
+    """
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+    
+    async def initialize(self) -> None:
+        pass
+    
+    async def shutdown(self) -> None:
+        pass
+    
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        """Wait for a token, then perform the request."""
+        async with self.bucket:
+            return await callback(*args, **kwargs)
+
+
 # ===========================
 # Input Validation
 # ===========================
@@ -1164,7 +1222,9 @@ async def cancel_conversation(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 def build_bot_app(settings: SettingsManager) -> Application:
     """Build and configure the Telegram bot application."""
-    application = Application.builder().token(BOT_TOKEN).build()
+    # Every outbound Bot API call shares one token bucket (Telegram's ~30 msg/s limit)
+    telegram_throttle = TokenBucketRateLimiter(TokenBucket(rate=TELEGRAM_RATE_LIMIT, capacity=TELEGRAM_BURST))
+    application = Application.builder().token(BOT_TOKEN).rate_limiter(telegram_throttle).build()
     
     # Store settings in bot_data
     application.bot_data["settings"] = settings
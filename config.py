@@ -29,6 +29,9 @@ if not BOT_TOKEN or BOT_TOKEN == "your_bot_token_here":
         "Please set a valid token in .env file (get it from @BotFather)"
     )
 
+# Bot ID is the token prefix before ':' (identifies the bot without exposing the secret)
+BOT_ID = BOT_TOKEN.split(":", 1)[0]
+
 # Chat ID for sending alerts (required, can be negative for groups)
 CHAT_ID_STR = os.environ.get("CHAT_ID")
 if not CHAT_ID_STR:
@@ -70,6 +73,16 @@ DISTANCE_PCT = float(os.environ.get("DISTANCE_PCT", "3.0"))
 MIN_SIZE = int(os.environ.get("MIN_SIZE", "1000000"))
 ALERTS_ENABLED = os.environ.get("ALERTS_ENABLED", "true").lower() in ("true", "1", "yes")
 
+ALERT_QUEUE_MAXSIZE_STR = os.environ.get("ALERT_QUEUE_MAXSIZE", "512")
+try:
+    ALERT_QUEUE_MAXSIZE = int(ALERT_QUEUE_MAXSIZE_STR)
+    if ALERT_QUEUE_MAXSIZE <= 0:
+        raise ValueError("ALERT_QUEUE_MAXSIZE must be positive")
+except ValueError as e:
+    raise ValueError(
+        f"❌ ALERT_QUEUE_MAXSIZE must be a positive integer, got: {ALERT_QUEUE_MAXSIZE_STR}"
+    ) from e
+
 # Supported Exchanges (name -> ccxt_id and label)
 SUPPORTED_EXCHANGES = {
     "hyperliquid": {"ccxt_id": "hyperliquid", "label": "Hyperliquid"},
@@ -122,6 +135,7 @@ DEFAULT_SETTINGS = {
     "authorized_users": [],  # List of authorized Telegram user IDs (empty = allow all)
     "quote_currencies": ["USDT", "USD", "USDC", "BUSD"],  # Supported quote currencies
     "chat_id": CHAT_ID,  # From .env
+    "alert_queue_maxsize": ALERT_QUEUE_MAXSIZE,  # Max pending alerts before oldest are dropped
     "exchanges": {
         "hyperliquid": {"min_size": MIN_SIZE, "ticker_overrides": {}, "blacklist": [], "min_lifetime": 0},
     },
@@ -145,6 +159,20 @@ RATE_LIMIT_SLEEP = 0.15  # Seconds to sleep between API calls
 MAX_RETRIES = 3  # Maximum number of retries for failed requests
 RETRY_DELAY = 5  # Seconds to wait before retrying
 
+# Telegram Alert Delivery Settings
+ALERT_BATCH_SIZE = 10  # Maximum alerts grouped into a single Telegram message
+ALERT_BATCH_DELAY = 1.0  # Seconds to wait between batch sends (Telegram rate limits)
+TELEGRAM_MESSAGE_LIMIT = 4000  # Safe margin below Telegram's 4096-char message limit
+ALERT_SEPARATOR = "\n\n─────\n\n"  # Separator between alerts in a grouped message
+TELEGRAM_BACKOFF_BASE = 1.0  # Initial backoff (seconds) after a Telegram timeout/network error
+TELEGRAM_BACKOFF_CAP = 30.0  # Maximum backoff (seconds) between Telegram send retries
+TELEGRAM_RATE_LIMIT = 30  # Outbound Telegram API calls per second (global bot limit)
+TELEGRAM_BURST = 30  # Token bucket capacity for short bursts of Telegram API calls
+
+# Chat access validation cache (skips the startup get_chat probe when fresh)
+CHAT_VALIDATION_CACHE_FILE = ".chat_validation.json"
+CHAT_VALIDATION_TTL = 24 * 3600  # Seconds a successful validation stays valid
+
 # Cooldown Settings
 ALERT_COOLDOWN = 300  # Seconds (5 minutes) - prevent duplicate alerts
 
@@ -31,6 +31,14 @@ except ImportError:
     ccxtpro = None
     logger.info("ccxt.pro not available, WebSocket support disabled. Install with: pip install ccxt[pro]")
 
+# Try to import numpy for vectorized density computation on array orderbooks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 from config import (
     SUPPORTED_EXCHANGES,
     RATE_LIMIT_SLEEP,
@@ -134,6 +142,57 @@ def get_size_emoji(size: float) -> str:
         return "💎💎💎"
 
 
+def _levels_to_array(levels) -> "np.ndarray":
+    """
+    Convert orderbook levels to a float64 (N, 2) [price, amount] array.
+    Extra per-level fields (e.g. ccxt's [price, amount, count]) are dropped.
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for array orderbooks. Install with: pip install numpy")
+    if len(levels) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.asarray(levels, dtype=np.float64)[:, :2]
+
+
+def orderbook_to_arrays(orderbook: dict) -> dict:
+    """
+    Convert a ccxt orderbook to float64 (N, 2) [price, amount] arrays.
+    The result can be passed to DensityScanner._compute_densities directly.
+    Raises ImportError if numpy is not installed.
+    """
+    return {
+        "bids": _levels_to_array(orderbook.get("bids", [])),
+        "asks": _levels_to_array(orderbook.get("asks", [])),
+    }
+
+
+def find_density_vectorized(levels, mid_price: float, max_distance: float,
+                            min_size: float, contract_size: float, side: str) -> Optional[Tuple[float, float]]:
+    """
+    Vectorized equivalent of the per-level density loop for one orderbook side.
+    Returns (volume, volume-weighted average price) of the first level run that
+    reaches min_size within max_distance, or None.
+    """
+    prices = levels[:, 0]
+    amounts = levels[:, 1]
+    distances = mid_price - prices if side == "bid" else prices - mid_price
+    
+    # Levels are sorted away from mid; stop at the first one out of range
+    out_of_range = distances > max_distance
+    end = int(np.argmax(out_of_range)) if out_of_range.any() else len(prices)
+    
+    quote_volumes = prices[:end] * amounts[:end] * contract_size
+    cumulative = np.cumsum(quote_volumes)
+    hit = int(np.searchsorted(cumulative, min_size))
+    if hit >= len(cumulative):
+        return None
+    
+    volume = float(cumulative[hit])
+    price_sum = float((prices[:hit + 1] * quote_volumes[:hit + 1]).sum())
+    avg_price = price_sum / volume if volume > 0 else float(prices[hit])
+    return volume, avg_price
+
+
 @dataclass
 class DensityAlert:
     """Represents a density alert detected in the order book."""
@@ -451,12 +510,13 @@ class DensityScanner:
         bids = orderbook.get('bids', [])
         asks = orderbook.get('asks', [])
         
-        if not bids or not asks:
+        # len() rather than truthiness so numpy array orderbooks are accepted too
+        if len(bids) == 0 or len(asks) == 0:
             return alerts
         
         # Calculate mid price
-        best_bid = bids[0][0] if bids else 0
-        best_ask = asks[0][0] if asks else 0
+        best_bid = float(bids[0][0])
+        best_ask = float(asks[0][0])
         
         # Division by zero check
         if best_bid == 0 or best_ask == 0:
@@ -473,6 +533,28 @@ class DensityScanner:
         # Calculate distance threshold
         max_distance = mid_price * (distance_pct / 100)
         
+        # Array orderbooks (see orderbook_to_arrays) take the vectorized path
+        if NUMPY_AVAILABLE and isinstance(bids, np.ndarray) and isinstance(asks, np.ndarray):
+            for side, levels in (("bid", bids), ("ask", asks)):
+                density = find_density_vectorized(
+                    levels, mid_price, max_distance, min_size, contract_size, side
+                )
+                if density is None:
+                    continue
+                volume, avg_price = density
+                signed_distance = mid_price - avg_price if side == "bid" else avg_price - mid_price
+                distance_from_mid = (signed_distance / mid_price) * 100
+                alerts.append(DensityAlert(
+                    exchange=exchange,
+                    symbol=symbol,
+                    side=side,
+                    volume=volume,
+                    price=avg_price,
+                    distance_pct=distance_from_mid,
+                    timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                ))
+            return alerts
+        
         # Check bids (below mid price)
         bid_volume = 0
         bid_price_sum = 0
@@ -808,10 +890,11 @@ class DensityScanner:
                         self._contract_size_cache.popitem(last=False)
                 
                 # Compute densities (using exchange_name key for URL/type lookups, not display label)
+                # Array orderbooks take the vectorized path when numpy is installed
                 densities = self._compute_densities(
                     exchange_name,
                     symbol,
-                    orderbook,
+                    orderbook_to_arrays(orderbook) if NUMPY_AVAILABLE else orderbook,
                     min_size,
                     distance_pct,
                     contract_size
@@ -984,11 +1067,11 @@ class DensityScanner:
                         min_size = self.settings.resolve_min_size(exchange_name, base_symbol)
                         distance_pct = self.settings.global_distance
                         
-                        # Compute densities
+                        # Compute densities (vectorized on array orderbooks when numpy is installed)
                         densities = self._compute_densities(
                             exchange_name,
                             symbol,
-                            orderbook,
+                            orderbook_to_arrays(orderbook) if NUMPY_AVAILABLE else orderbook,
                             min_size,
                             distance_pct,
                             contract_size
@@ -1,16 +1,23 @@
 """
 Settings Manager for persistent configuration with per-exchange settings.
-Provides thread-safe access to settings from .env file (read-only).
+Provides thread-safe access to settings from .env file (read-only); the only
+file it writes is the chat validation cache (.chat_validation.json).
 """
 
+import json
+import os
 import threading
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional
 from config import (
     DEFAULT_SETTINGS,
     DEFAULT_EXCHANGE_SETTINGS,
+    BOT_ID,
     CHAT_ID,
     DISTANCE_PCT,
     ALERTS_ENABLED,
+    ALERT_QUEUE_MAXSIZE,
+    CHAT_VALIDATION_CACHE_FILE,
 )
 
 
@@ -27,6 +34,8 @@ class SettingsManager:
         self._lock = threading.Lock()
         # Use default settings which are populated from .env
         self._settings = DEFAULT_SETTINGS.copy()
+        # Loaded on demand by load_chat_validation(), not on construction
+        self.chat_validation_file = CHAT_VALIDATION_CACHE_FILE
     
     # Global Settings Properties (Read-Only from .env)
     
@@ -69,6 +78,84 @@ class SettingsManager:
         with self._lock:
             self._settings["chat_id"] = value
     
+    # Chat Validation Cache (persisted to chat_validation_file)
+    
+    def load_chat_validation(self):
+        """Load the last successful chat validation from disk, if any."""
+        try:
+            with open(self.chat_validation_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            chat_id = int(data["chat_id"])
+            validated_at = float(data["validated_at"])
+            chat_type = data.get("chat_type")
+            bot_id = data.get("bot_id")
+        except (OSError, ValueError, KeyError, TypeError):
+            return  # Missing or corrupt cache - chat will be validated again
+        with self._lock:
+            self._settings["last_validated_chat_id"] = chat_id
+            self._settings["last_validated_at"] = validated_at
+            self._settings["last_validated_chat_type"] = chat_type
+            self._settings["last_validated_bot_id"] = bot_id
+    
+    @property
+    def last_validated_chat_id(self) -> Optional[int]:
+        with self._lock:
+            return self._settings.get("last_validated_chat_id")
+    
+    @property
+    def last_validated_at(self) -> float:
+        with self._lock:
+            return self._settings.get("last_validated_at", 0.0)
+    
+    @property
+    def last_validated_chat_type(self) -> Optional[str]:
+        with self._lock:
+            return self._settings.get("last_validated_chat_type")
+    
+    def mark_chat_validated(self, chat_id: int, chat_type: str):
+        """Record a successful chat validation in memory and on disk."""
+        validated_at = time.time()
+        with self._lock:
+            self._settings["last_validated_chat_id"] = chat_id
+            self._settings["last_validated_at"] = validated_at
+            self._settings["last_validated_chat_type"] = chat_type
+            self._settings["last_validated_bot_id"] = BOT_ID
+        try:
+            with open(self.chat_validation_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "bot_id": BOT_ID,
+                        "chat_id": chat_id,
+                        "chat_type": chat_type,
+                        "validated_at": validated_at,
+                    },
+                    f,
+                )
+        except OSError:
+            pass  # Cache is best-effort; the chat is simply re-validated next start
+    
+    def has_fresh_chat_validation(self, ttl: float) -> bool:
+        """Check if the current bot and chat ID were validated less than `ttl` seconds ago."""
+        with self._lock:
+            if self._settings.get("last_validated_bot_id") != BOT_ID:
+                return False  # Validated with another bot token
+            chat_id = self._settings.get("chat_id", CHAT_ID)
+            if chat_id != self._settings.get("last_validated_chat_id"):
+                return False
+            return time.time() - self._settings.get("last_validated_at", 0.0) < ttl
+    
+    def clear_chat_validation(self):
+        """Forget the cached chat validation in memory and on disk."""
+        with self._lock:
+            self._settings.pop("last_validated_chat_id", None)
+            self._settings.pop("last_validated_at", None)
+            self._settings.pop("last_validated_chat_type", None)
+            self._settings.pop("last_validated_bot_id", None)
+        try:
+            os.remove(self.chat_validation_file)
+        except OSError:
+            pass  # Already gone, or removal failed (a stale file still expires via the TTL)
+    
     @property
     def global_distance(self) -> float:
         with self._lock:
@@ -102,6 +189,11 @@ class SettingsManager:
         with self._lock:
             self._settings["orderbook_depth"] = value
     
+    @property
+    def alert_queue_maxsize(self) -> int:
+        with self._lock:
+            return self._settings.get("alert_queue_maxsize", ALERT_QUEUE_MAXSIZE)
+    
     @property
     def global_blacklist(self) -> List[str]:
         """Get the global blacklist."""
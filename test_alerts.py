@@ -0,0 +1,268 @@
+"""
+Alert Delivery Tests
+Tests the coalescing alert buffer, alert message grouping and the outbound
+Telegram rate limiter.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import AlertBuffer, group_alert_messages
+from bot import TokenBucket, TokenBucketRateLimiter, build_bot_app
+from config import TELEGRAM_MESSAGE_LIMIT, ALERT_SEPARATOR, TELEGRAM_RATE_LIMIT
+from scanner import DensityAlert
+from settings_manager import SettingsManager
+
+
+def make_alert(symbol: str, side: str = "bid", volume: float = 1_000_000) -> DensityAlert:
+    """Build a density alert for the given ticker."""
+    return DensityAlert(
+        exchange="hyperliquid",
+        symbol=f"{symbol}/USD:USD",
+        side=side,
+        volume=volume,
+        price=100.0,
+        distance_pct=1.0,
+        timestamp="2024-01-01 00:00:00",
+    )
+
+
+def pending_symbols(buffer: AlertBuffer) -> list:
+    """Pop every pending alert and return their base symbols in send order."""
+    batch = asyncio.run(buffer.get_batch(len(buffer)))
+    return [alert.symbol.split("/")[0] for alert in batch]
+
+
+def test_alert_buffer_latest_wins():
+    """Test: A newer alert replaces the pending one and moves to the back."""
+    print("\n" + "="*80)
+    print("TEST: Alert Buffer Latest-Wins Coalescing")
+    print("="*80)
+    
+    buffer = AlertBuffer(maxsize=10)
+    buffer.put(make_alert("A", volume=1_000_000))
+    buffer.put(make_alert("B"))
+    buffer.put(make_alert("A", volume=2_000_000))
+    buffer.put(make_alert("A", side="ask"))
+    
+    assert len(buffer) == 3, f"Expected 3 pending alerts, got {len(buffer)}"
+    batch = asyncio.run(buffer.get_batch(10))
+    order = [(a.symbol.split("/")[0], a.side) for a in batch]
+    print(f"\nSend order: {order}")
+    
+    assert order == [("B", "bid"), ("A", "bid"), ("A", "ask")], f"Unexpected order: {order}"
+    assert batch[1].volume == 2_000_000, "Refreshed alert should carry the latest volume"
+    print("✅ TEST PASSED: Latest alert kept per (exchange, symbol, side), refreshed key moved to back")
+    
+    return True
+
+
+def test_alert_buffer_eviction():
+    """Test: A full buffer drops the oldest pending alert."""
+    print("\n" + "="*80)
+    print("TEST: Alert Buffer Oldest Eviction")
+    print("="*80)
+    
+    buffer = AlertBuffer(maxsize=3)
+    for symbol in ("A", "B", "C"):
+        buffer.put(make_alert(symbol))
+    buffer.put(make_alert("A", volume=2_000_000))  # Refresh: no eviction, A moves to back
+    buffer.put(make_alert("D"))  # Full: evicts B (now the oldest)
+    
+    order = pending_symbols(buffer)
+    print(f"\nSend order: {order}")
+    assert order == ["C", "A", "D"], f"Expected ['C', 'A', 'D'], got {order}"
+    print("✅ TEST PASSED: Oldest alert evicted, refreshed key survives")
+    
+    # Non-positive sizes are rejected instead of failing on the first put
+    for maxsize in (0, -1):
+        try:
+            AlertBuffer(maxsize=maxsize)
+            print(f"❌ FAILED - maxsize={maxsize} should have raised ValueError")
+            return False
+        except ValueError as e:
+            print(f"Correctly raised ValueError: {e}")
+    print("✅ TEST PASSED: Non-positive maxsize rejected")
+    
+    return True
+
+
+def test_alert_buffer_get_batch():
+    """Test: get_batch honours the limit and waits for new alerts."""
+    print("\n" + "="*80)
+    print("TEST: Alert Buffer Batch Limits")
+    print("="*80)
+    
+    async def scenario():
+        buffer = AlertBuffer(maxsize=10)
+        for symbol in ("A", "B", "C", "D", "E"):
+            buffer.put(make_alert(symbol))
+        
+        first = await buffer.get_batch(2)
+        second = await buffer.get_batch(2)
+        third = await buffer.get_batch(2)
+        
+        # Empty buffer: get_batch waits until the next put
+        waiter = asyncio.create_task(buffer.get_batch(2))
+        await asyncio.sleep(0.01)
+        assert not waiter.done(), "get_batch should wait while the buffer is empty"
+        buffer.put(make_alert("F"))
+        fourth = await asyncio.wait_for(waiter, timeout=1)
+        
+        return [[a.symbol.split("/")[0] for a in batch] for batch in (first, second, third, fourth)]
+    
+    batches = asyncio.run(scenario())
+    print(f"\nBatches: {batches}")
+    assert batches == [["A", "B"], ["C", "D"], ["E"], ["F"]], f"Unexpected batches: {batches}"
+    print("✅ TEST PASSED: Batches limited, FIFO order kept, consumer woken by put")
+    
+    return True
+
+
+def test_group_alert_messages_split():
+    """Test: Alerts are split into messages below the Telegram length limit."""
+    print("\n" + "="*80)
+    print("TEST: Alert Message Grouping and Splitting")
+    print("="*80)
+    
+    # Enough alerts to overflow a single message several times
+    alerts = [make_alert(f"T{i}") for i in range(40)]
+    alert_length = len(alerts[0].format_message())
+    print(f"\nAlerts: {len(alerts)} x ~{alert_length} chars, limit: {TELEGRAM_MESSAGE_LIMIT}")
+    
+    messages = group_alert_messages(alerts)
+    print(f"Messages: {len(messages)}, alerts per message: {[count for _, count in messages]}")
+    
+    assert len(messages) > 1, "Expected alerts to be split across several messages"
+    for message, count in messages:
+        assert len(message) <= TELEGRAM_MESSAGE_LIMIT, f"Message too long: {len(message)}"
+        assert message.count(ALERT_SEPARATOR) == count - 1, "Alert count does not match message"
+    
+    total = sum(count for _, count in messages)
+    assert total == len(alerts), f"Expected {len(alerts)} alerts in total, got {total}"
+    
+    # Alert order is preserved across split messages
+    joined = ALERT_SEPARATOR.join(message for message, _ in messages)
+    assert joined == ALERT_SEPARATOR.join(a.format_message() for a in alerts), "Alert order changed"
+    print("✅ TEST PASSED: Messages respect the limit and keep every alert in order")
+    
+    # A small batch fits into a single message
+    messages = group_alert_messages(alerts[:2])
+    assert len(messages) == 1 and messages[0][1] == 2, f"Expected one message with 2 alerts, got {messages}"
+    assert group_alert_messages([]) == [], "Empty batch should produce no messages"
+    print("✅ TEST PASSED: Small and empty batches")
+    
+    return True
+
+
+def test_token_bucket_rate_limiter():
+    """Test: Requests beyond the burst capacity are delayed to the bucket rate, in order."""
+    print("\n" + "="*80)
+    print("TEST: Token Bucket Rate Limiter")
+    print("="*80)
+    
+    rate, capacity, requests = 20, 5, 15
+    
+    async def scenario():
+        limiter = TokenBucketRateLimiter(TokenBucket(rate=rate, capacity=capacity))
+        calls = []
+        
+        async def callback(index):
+            calls.append((index, time.monotonic()))
+            return True
+        
+        start = time.monotonic()
+        results = await asyncio.gather(*(
+            limiter.process_request(callback, (i,), {}, "sendMessage", {}, None)
+            for i in range(requests)
+        ))
+        return start, calls, results
+    
+    start, calls, results = asyncio.run(scenario())
+    elapsed = calls[-1][1] - start
+    burst_elapsed = calls[capacity - 1][1] - start
+    expected = (requests - capacity) / rate
+    print(f"\n{requests} requests, capacity {capacity}, rate {rate}/s")
+    print(f"Burst served in {burst_elapsed:.3f}s, all served in {elapsed:.3f}s (expected ~{expected:.2f}s)")
+    
+    assert all(results), "Callback results not returned"
+    assert [index for index, _ in calls] == list(range(requests)), "Requests not served in arrival order"
+    assert burst_elapsed < 0.05, f"Burst should not wait, took {burst_elapsed:.3f}s"
+    assert elapsed >= expected * 0.9, f"Requests beyond the burst were not throttled ({elapsed:.3f}s)"
+    print("✅ TEST PASSED: Burst absorbed, remaining requests throttled in order")
+    
+    # The bot application routes every Bot API request through the limiter
+    bot_app = build_bot_app(SettingsManager(":memory:"))
+    limiter = bot_app.bot.rate_limiter
+    assert isinstance(limiter, TokenBucketRateLimiter), f"Unexpected bot rate limiter: {limiter!r}"
+    assert limiter.bucket.rate == TELEGRAM_RATE_LIMIT, "Bot limiter not using TELEGRAM_RATE_LIMIT"
+    print("✅ TEST PASSED: build_bot_app installs the token bucket limiter")
+    
+    return True
+
+
+def run_all_tests():
+    """Run all alert delivery tests."""
+    print("=" * 80)
+    print("Alert Delivery Tests")
+    print("=" * 80)
+    
+    tests = [
+        ("Buffer Latest-Wins", test_alert_buffer_latest_wins),
+        ("Buffer Eviction", test_alert_buffer_eviction),
+        ("Buffer Batch Limits", test_alert_buffer_get_batch),
+        ("Message Grouping", test_group_alert_messages_split),
+        ("Rate Limiter", test_token_bucket_rate_limiter),
+    ]
+    
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_name, "PASSED" if result else "FAILED", None))
+        except Exception as e:
+            print(f"\n❌ TEST FAILED: {test_name}")
+            print(f"   Error: {e}")
+            results.append((test_name, "FAILED", str(e)))
+    
+    # Print summary
+    print("\n" + "=" * 80)
+    print("## 📊 TEST SUMMARY")
+    print("=" * 80)
+    
+    total = len(results)
+    passed = sum(1 for _, status, _ in results if status == "PASSED")
+    failed = total - passed
+    
+    print(f"\n- **Total Tests:** {total}")
+    print(f"- **✅ Passed:** {passed}")
+    print(f"- **❌ Failed:** {failed}")
+    print(f"- **Success Rate:** {(passed/total*100):.1f}%")
+    
+    print("\n### Test Details:")
+    for test_name, status, error in results:
+        symbol = "✅" if status == "PASSED" else "❌"
+        print(f"{symbol} {test_name}: {status}")
+        if error:
+            print(f"   Error: {error}")
+    
+    print("\n" + "=" * 80)
+    
+    if failed == 0:
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 80)
+        return True
+    else:
+        print(f"❌ {failed} TEST(S) FAILED")
+        print("=" * 80)
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
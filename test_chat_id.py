@@ -1,19 +1,17 @@
 """
 Test Chat ID parsing and handling.
-Tests backward compatibility and proper integer conversion.
+Tests proper integer conversion of the configured and runtime chat ID.
 """
 
 import sys
 import os
 import tempfile
-from pathlib import Path
-import uuid
 
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from settings_manager import SettingsManager
-from config import DEFAULT_CHAT_ID
+from config import CHAT_ID
 
 
 def test_chat_id_integer_conversion():
@@ -22,11 +20,9 @@ def test_chat_id_integer_conversion():
     print("TEST: Chat ID Integer Conversion")
     print("="*80)
     
-    # Note: Using current directory for temp file because SettingsManager has
-    # path traversal protection that requires files to be in current directory
-    temp_file = f"test_settings_{uuid.uuid4().hex}.json"
-    
-    try:
+    # TemporaryDirectory cleans up even if the test fails, and keeps cwd clean
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = os.path.join(temp_dir, "settings.json")
         settings = SettingsManager(temp_file)
         
         # Test 1: Set string chat ID (backward compatibility)
@@ -81,57 +77,25 @@ def test_chat_id_integer_conversion():
         
         print("\n✅ ALL TESTS PASSED")
         return True
-        
-    finally:
-        # Cleanup
-        Path(temp_file).unlink(missing_ok=True)
 
 
-def test_default_chat_id_from_config():
-    """Test: DEFAULT_CHAT_ID from config is an integer."""
+def test_chat_id_from_config():
+    """Test: CHAT_ID from config is an integer."""
     print("\n" + "="*80)
-    print("TEST: DEFAULT_CHAT_ID from config.py")
+    print("TEST: CHAT_ID from config.py")
     print("="*80)
     
-    print(f"\nDEFAULT_CHAT_ID: {DEFAULT_CHAT_ID}")
-    print(f"Type: {type(DEFAULT_CHAT_ID).__name__}")
-    
-    assert isinstance(DEFAULT_CHAT_ID, int), f"Expected int, got {type(DEFAULT_CHAT_ID)}"
-    print("✅ DEFAULT_CHAT_ID is an integer")
+    print(f"\nCHAT_ID: {CHAT_ID}")
+    print(f"Type: {type(CHAT_ID).__name__}")
     
-    return True
-
-
-def test_backward_compatibility():
-    """Test: Settings with old string format are converted properly."""
-    print("\n" + "="*80)
-    print("TEST: Backward Compatibility")
-    print("="*80)
+    assert isinstance(CHAT_ID, int), f"Expected int, got {type(CHAT_ID)}"
+    print("✅ CHAT_ID is an integer")
     
-    # Note: Using current directory for temp file because SettingsManager has
-    # path traversal protection that requires files to be in current directory
-    temp_file = f"test_settings_old_{uuid.uuid4().hex}.json"
+    settings = SettingsManager()
+    assert settings.chat_id == CHAT_ID, f"Expected {CHAT_ID}, got {settings.chat_id}"
+    print("✅ SettingsManager defaults to the configured CHAT_ID")
     
-    try:
-        # Write old-style settings with string chat_id
-        with open(temp_file, 'w') as f:
-            f.write('{"chat_id": "-1003892216818", "alerts_enabled": false}')
-        
-        settings = SettingsManager(temp_file)
-        result = settings.chat_id
-        
-        print(f"\nLoaded old-format chat_id from file: '{result}'")
-        print(f"Type after loading: {type(result).__name__}")
-        
-        assert isinstance(result, int), f"Expected int, got {type(result)}"
-        assert result == -1003892216818, f"Expected -1003892216818, got {result}"
-        print("✅ Old string format correctly converted to integer")
-        
-        return True
-        
-    finally:
-        # Cleanup
-        Path(temp_file).unlink(missing_ok=True)
+    return True
 
 
 def run_all_tests():
@@ -141,9 +105,8 @@ def run_all_tests():
     print("=" * 80)
     
     tests = [
-        ("DEFAULT_CHAT_ID Type Check", test_default_chat_id_from_config),
+        ("CHAT_ID Type Check", test_chat_id_from_config),
         ("Integer Conversion", test_chat_id_integer_conversion),
-        ("Backward Compatibility", test_backward_compatibility),
     ]
     
     results = []
@@ -0,0 +1,274 @@
+"""
+Chat Validation Cache Tests
+Tests loading, expiry and clearing of the cached startup chat validation.
+"""
+
+import sys
+import os
+import asyncio
+import json
+import time
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from telegram.error import BadRequest, ChatMigrated, Forbidden
+
+import app
+from settings_manager import SettingsManager
+from config import BOT_ID, CHAT_VALIDATION_TTL
+from scanner import DensityAlert
+
+
+def make_settings(temp_dir: str) -> SettingsManager:
+    """Create a settings manager whose validation cache lives in temp_dir."""
+    settings = SettingsManager(":memory:")
+    settings.chat_validation_file = os.path.join(temp_dir, "chat_validation.json")
+    return settings
+
+
+def write_cache(path: str, chat_id: int, validated_at: float, chat_type: str = "supergroup",
+                bot_id: str = BOT_ID):
+    """Write a validation cache file like mark_chat_validated does."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"bot_id": bot_id, "chat_id": chat_id, "chat_type": chat_type, "validated_at": validated_at},
+            f,
+        )
+
+
+def test_load_chat_validation():
+    """Test: A recent cache entry for the configured chat is loaded and fresh."""
+    print("\n" + "="*80)
+    print("TEST: Load Chat Validation Cache")
+    print("="*80)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        settings = make_settings(temp_dir)
+        
+        # Nothing is read until load_chat_validation() is called
+        write_cache(settings.chat_validation_file, settings.chat_id, time.time())
+        assert settings.last_validated_chat_id is None, "Cache should not load on construction"
+        
+        settings.load_chat_validation()
+        print(f"\nLoaded: chat_id={settings.last_validated_chat_id}, type={settings.last_validated_chat_type}")
+        assert settings.last_validated_chat_id == settings.chat_id, "Cached chat ID not loaded"
+        assert settings.last_validated_chat_type == "supergroup", "Cached chat type not loaded"
+        assert settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Fresh cache should be accepted"
+        print("✅ TEST PASSED: Cache loaded on demand and accepted")
+        
+        # Missing file leaves the manager unvalidated
+        os.remove(settings.chat_validation_file)
+        settings = make_settings(temp_dir)
+        settings.load_chat_validation()
+        assert not settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Missing cache must not validate"
+        print("✅ TEST PASSED: Missing cache file ignored")
+    
+    return True
+
+
+def test_corrupt_chat_validation():
+    """Test: A corrupt or incomplete cache file is ignored."""
+    print("\n" + "="*80)
+    print("TEST: Corrupt Chat Validation Cache")
+    print("="*80)
+    
+    corrupt_contents = [
+        "not json at all",
+        '{"chat_id": "abc", "validated_at": 1}',
+        '{"validated_at": 1}',
+        '["chat_id", 1]',
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for contents in corrupt_contents:
+            settings = make_settings(temp_dir)
+            with open(settings.chat_validation_file, "w", encoding="utf-8") as f:
+                f.write(contents)
+            
+            settings.load_chat_validation()
+            assert settings.last_validated_chat_id is None, f"Corrupt cache loaded: {contents!r}"
+            assert not settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), f"Corrupt cache validated: {contents!r}"
+            print(f"  ✅ Ignored: {contents!r}")
+    
+    print("✅ TEST PASSED: Corrupt cache files are ignored")
+    return True
+
+
+def test_chat_validation_expiry():
+    """Test: Expired entries and entries for another chat or bot are not fresh."""
+    print("\n" + "="*80)
+    print("TEST: Chat Validation Cache Expiry")
+    print("="*80)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        settings = make_settings(temp_dir)
+        write_cache(settings.chat_validation_file, settings.chat_id, time.time() - CHAT_VALIDATION_TTL - 1)
+        settings.load_chat_validation()
+        assert not settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Expired cache must not validate"
+        print("\n✅ Entry older than the TTL is rejected")
+        
+        settings = make_settings(temp_dir)
+        write_cache(settings.chat_validation_file, settings.chat_id + 1, time.time())
+        settings.load_chat_validation()
+        assert not settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Cache for another chat must not validate"
+        print("✅ Entry for a different chat ID is rejected")
+        
+        settings = make_settings(temp_dir)
+        write_cache(settings.chat_validation_file, settings.chat_id, time.time(), bot_id=BOT_ID + "0")
+        settings.load_chat_validation()
+        assert not settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Cache for another bot must not validate"
+        print("✅ Entry for a different bot token is rejected")
+        
+        settings = make_settings(temp_dir)
+        with open(settings.chat_validation_file, "w", encoding="utf-8") as f:
+            json.dump({"chat_id": settings.chat_id, "validated_at": time.time()}, f)
+        settings.load_chat_validation()
+        assert not settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Cache without bot ID must not validate"
+        print("✅ Entry without a bot ID is rejected")
+    
+    print("✅ TEST PASSED: Cache expiry, chat ID and bot change")
+    return True
+
+
+def test_mark_and_clear_chat_validation():
+    """Test: mark_chat_validated persists the entry and clear_chat_validation removes it."""
+    print("\n" + "="*80)
+    print("TEST: Mark and Clear Chat Validation")
+    print("="*80)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        settings = make_settings(temp_dir)
+        settings.mark_chat_validated(settings.chat_id, "group")
+        assert os.path.exists(settings.chat_validation_file), "Cache file not written"
+        
+        # A new manager (next start) sees the persisted entry
+        restarted = make_settings(temp_dir)
+        restarted.load_chat_validation()
+        assert restarted.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Persisted cache not accepted"
+        print("\n✅ Validation persisted across restarts")
+        
+        restarted.clear_chat_validation()
+        assert restarted.last_validated_chat_id is None, "In-memory cache not cleared"
+        assert not restarted.has_fresh_chat_validation(CHAT_VALIDATION_TTL), "Cleared cache still fresh"
+        assert not os.path.exists(restarted.chat_validation_file), "Cache file not removed"
+        restarted.clear_chat_validation()  # Clearing twice is harmless
+        print("✅ Validation cleared in memory and on disk")
+    
+    print("✅ TEST PASSED: Mark and clear")
+    return True
+
+
+def test_unreachable_chat_clears_validation():
+    """Test: Send errors meaning the chat is unreachable drop the cached validation."""
+    print("\n" + "="*80)
+    print("TEST: Unreachable Chat Clears Validation Cache")
+    print("="*80)
+    
+    class UnreachableChatBot:
+        """Fake bot whose sends to the alert chat fail with a fixed error."""
+        def __init__(self, error: Exception):
+            self.error = error
+        
+        async def send_message(self, chat_id, text, **kwargs):
+            raise self.error
+    
+    async def scenario(settings: SettingsManager, bot: UnreachableChatBot):
+        alert_buffer = app.AlertBuffer(maxsize=10)
+        alert_buffer.put(DensityAlert(
+            exchange="hyperliquid", symbol="BTC/USD:USD", side="bid", volume=1_000_000,
+            price=100.0, distance_pct=1.0, timestamp="2024-01-01 00:00:00",
+        ))
+        task = asyncio.create_task(app.process_alerts(bot, settings, alert_buffer))
+        while len(alert_buffer):
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        task.cancel()
+    
+    errors = [
+        BadRequest("Chat not found"),
+        Forbidden("Forbidden: bot was kicked from the supergroup chat"),
+        ChatMigrated(-1001234567890),
+    ]
+    
+    for error in errors:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings = make_settings(temp_dir)
+            settings.mark_chat_validated(settings.chat_id, "supergroup")
+            
+            app.ALERT_BATCH_DELAY, delay = 0, app.ALERT_BATCH_DELAY
+            try:
+                asyncio.run(scenario(settings, UnreachableChatBot(error)))
+            finally:
+                app.ALERT_BATCH_DELAY = delay
+            
+            name = type(error).__name__
+            assert not settings.has_fresh_chat_validation(CHAT_VALIDATION_TTL), f"{name}: validation still cached in memory"
+            assert not os.path.exists(settings.chat_validation_file), f"{name}: validation cache file not removed"
+            print(f"  ✅ Cleared on {name}: {error.message}")
+    
+    print("\n✅ TEST PASSED: Next start will probe the chat again")
+    return True
+
+
+def run_all_tests():
+    """Run all chat validation cache tests."""
+    print("=" * 80)
+    print("Chat Validation Cache Tests")
+    print("=" * 80)
+    
+    tests = [
+        ("Load Cache", test_load_chat_validation),
+        ("Corrupt Cache", test_corrupt_chat_validation),
+        ("Cache Expiry", test_chat_validation_expiry),
+        ("Mark and Clear", test_mark_and_clear_chat_validation),
+        ("Unreachable Chat", test_unreachable_chat_clears_validation),
+    ]
+    
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_name, "PASSED" if result else "FAILED", None))
+        except Exception as e:
+            print(f"\n❌ TEST FAILED: {test_name}")
+            print(f"   Error: {e}")
+            results.append((test_name, "FAILED", str(e)))
+    
+    # Print summary
+    print("\n" + "=" * 80)
+    print("## 📊 TEST SUMMARY")
+    print("=" * 80)
+    
+    total = len(results)
+    passed = sum(1 for _, status, _ in results if status == "PASSED")
+    failed = total - passed
+    
+    print(f"\n- **Total Tests:** {total}")
+    print(f"- **✅ Passed:** {passed}")
+    print(f"- **❌ Failed:** {failed}")
+    print(f"- **Success Rate:** {(passed/total*100):.1f}%")
+    
+    print("\n### Test Details:")
+    for test_name, status, error in results:
+        symbol = "✅" if status == "PASSED" else "❌"
+        print(f"{symbol} {test_name}: {status}")
+        if error:
+            print(f"   Error: {error}")
+    
+    print("\n" + "=" * 80)
+    
+    if failed == 0:
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 80)
+        return True
+    else:
+        print(f"❌ {failed} TEST(S) FAILED")
+        print("=" * 80)
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -11,7 +11,8 @@ from typing import Dict, Any
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from scanner import DensityScanner
+import scanner as scanner_module
+from scanner import DensityScanner, NUMPY_AVAILABLE, orderbook_to_arrays
 from settings_manager import SettingsManager
 
 # Test configuration for supported exchanges
@@ -123,6 +124,79 @@ def test_hyperliquid_symbol_format():
     return True
 
 
+def test_vectorized_orderbook_matches_lists():
+    """Test: NumPy array orderbooks produce the same densities as list orderbooks."""
+    print("\n" + "="*80)
+    print("TEST: Vectorized (NumPy) Orderbook Processing")
+    print("="*80)
+    
+    # Without numpy, conversion fails with a clear ImportError
+    scanner_module.NUMPY_AVAILABLE, numpy_available = False, scanner_module.NUMPY_AVAILABLE
+    try:
+        orderbook_to_arrays({"bids": [[50000, 10]], "asks": [[50100, 1]]})
+        assert False, "Expected ImportError without numpy"
+    except ImportError as e:
+        print(f"\n  ✅ Without numpy: {e}")
+    finally:
+        scanner_module.NUMPY_AVAILABLE = numpy_available
+    
+    if not NUMPY_AVAILABLE:
+        print("\n⚠️ numpy not installed, skipping vectorized path check")
+        return True
+    
+    settings = SettingsManager(":memory:")
+    scanner = DensityScanner(settings, lambda alert: None)
+    
+    orderbook = {
+        "bids": [[50000, 10], [49900, 6], [49800, 4], [40000, 100]],
+        "asks": [[50100, 1], [50200, 2], [50300, 30], [60000, 100]],
+    }
+    
+    cases = [
+        (900000, 1.0),    # Bid density reached on the third level
+        (1000000, 1.0),   # Ask density reached, bid falls short
+        (100000000, 1.0), # Nothing reaches min_size
+        (900000, 0.1),    # Distance filter cuts the book before min_size
+    ]
+    
+    for min_size, distance_pct in cases:
+        expected = scanner._compute_densities("test", "BTC/USDT", orderbook, min_size, distance_pct)
+        actual = scanner._compute_densities(
+            "test", "BTC/USDT", orderbook_to_arrays(orderbook), min_size, distance_pct
+        )
+        
+        assert len(actual) == len(expected), f"Alert count mismatch: {len(actual)} != {len(expected)}"
+        for exp, act in zip(expected, actual):
+            assert act.side == exp.side, f"Side mismatch: {act.side} != {exp.side}"
+            assert abs(act.volume - exp.volume) < 1e-6, f"Volume mismatch: {act.volume} != {exp.volume}"
+            assert abs(act.price - exp.price) < 1e-6, f"Price mismatch: {act.price} != {exp.price}"
+            assert abs(act.distance_pct - exp.distance_pct) < 1e-9, "Distance mismatch"
+        print(f"  ✅ min_size={min_size:,}, distance={distance_pct}%: {len(actual)} alert(s) match")
+    
+    
+    # ccxt levels may carry extra fields such as [price, amount, count]
+    orderbook_with_counts = {
+        "bids": [[price, amount, 3] for price, amount in orderbook["bids"]],
+        "asks": [[price, amount, 3] for price, amount in orderbook["asks"]],
+    }
+    arrays = orderbook_to_arrays(orderbook_with_counts)
+    assert arrays["bids"].shape == (4, 2), f"Unexpected bids shape: {arrays['bids'].shape}"
+    assert arrays["bids"].tolist() == [[float(p), float(a)] for p, a in orderbook["bids"]], "Bid levels corrupted"
+    expected = scanner._compute_densities("test", "BTC/USDT", orderbook_with_counts, 900000, 1.0)
+    actual = scanner._compute_densities("test", "BTC/USDT", arrays, 900000, 1.0)
+    assert [(a.side, a.volume) for a in actual] == [(e.side, e.volume) for e in expected], "Extra-field book mismatch"
+    print("  ✅ Levels with extra fields keep only [price, amount]")
+    
+    # Empty sides convert to (0, 2) arrays and yield no alerts
+    arrays = orderbook_to_arrays({"bids": [], "asks": orderbook["asks"]})
+    assert arrays["bids"].shape == (0, 2), f"Unexpected empty bids shape: {arrays['bids'].shape}"
+    assert scanner._compute_densities("test", "BTC/USDT", arrays, 900000, 1.0) == [], "Empty side should yield no alerts"
+    print("  ✅ Empty sides handled")
+    
+    print("✅ TEST PASSED: Vectorized path matches list-based computation")
+    return True
+
+
 def test_all_exchanges_individual_volumes():
     """Test: Verify all exchanges use individual volumes (not cumulative)."""
     print("\n" + "="*80)
@@ -163,6 +237,7 @@ def run_all_tests():
         ("Configuration Check", test_all_exchanges_individual_volumes),
         ("Individual vs Cumulative", test_individual_vs_cumulative_volumes),
         ("Hyperliquid Symbols", test_hyperliquid_symbol_format),
+        ("Vectorized Orderbook", test_vectorized_orderbook_matches_lists),
     ]
     
     results = []